@@ -126,11 +126,13 @@ def register_datetime_tools(server: FastMCP, ping_client):
             
             if parsed_time is None:
                 # Try common PingOne-specific patterns
+                now = datetime.now(timezone.utc)
+                midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
                 common_patterns = {
-                    "today": datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0),
-                    "yesterday": datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1),
-                    "this week": datetime.now(timezone.utc) - timedelta(days=datetime.now(timezone.utc).weekday()),
-                    "last week": datetime.now(timezone.utc) - timedelta(days=datetime.now(timezone.utc).weekday() + 7),
+                    "today": midnight,
+                    "yesterday": midnight - timedelta(days=1),
+                    "this week": now - timedelta(days=now.weekday()),
+                    "last week": now - timedelta(days=now.weekday() + 7),
                 }
                 
                 parsed_time = common_patterns.get(time_expression.lower())
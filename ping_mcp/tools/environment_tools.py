@@ -1,7 +1,6 @@
 """Environment management tools for PingOne MCP server."""
 
 import logging
-import re
 from typing import List, Dict, Any, Optional, Union, Annotated, Literal
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
@@ -16,14 +15,6 @@ logger = logging.getLogger("ping_mcp_server")
 def register_environment_tools(server: FastMCP, ping_client: PingOneClient):
     """Register all environment-related tools with the MCP server."""
     
-    def is_valid_uuid(value: str) -> bool:
-        """Check if a string is a valid UUID format."""
-        uuid_pattern = re.compile(
-            r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', 
-            re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(value))
-    
     @server.tool()
     async def list_configured_environments(
         ctx: Context | None = None
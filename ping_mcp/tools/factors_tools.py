@@ -1,7 +1,6 @@
 """User MFA factor management tools for PingOne MCP server."""
 
 import logging
-import re
 from typing import List, Dict, Any, Optional, Union, Annotated, Literal
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
@@ -9,20 +8,13 @@ from pydantic import Field
 
 from ..utils.ping_client import PingOneClient
 from ..utils.normalize_ping_responses import PingOneResponseHandler
+from ..utils.validation import is_valid_uuid
 
 logger = logging.getLogger("ping_mcp_server")
 
 def register_user_factor_tools(server: FastMCP, ping_client: PingOneClient):
     """Register all user MFA factor-related tools with the MCP server."""
     
-    def is_valid_uuid(value: str) -> bool:
-        """Check if a string is a valid UUID format."""
-        uuid_pattern = re.compile(
-            r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', 
-            re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(value))
-    
     @server.tool()
     async def list_pingone_user_mfa_devices(
         user_id: Annotated[str, Field(description="User UUID from list_pingone_users")],
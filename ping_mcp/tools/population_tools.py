@@ -1,31 +1,54 @@
 """Population management tools for PingOne MCP server."""
 
 import logging
-import re
-from typing import List, Dict, Any, Optional, Union, Annotated, Literal
+import time
+from typing import List, Dict, Any, Optional, Tuple, Union, Annotated, Literal
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from ..utils.ping_client import PingOneClient
 from ..utils.normalize_ping_responses import PingOneResponseHandler
+from ..utils.error_handling import raise_api_error
+from ..utils.ttl_cache import AsyncTTLCache
+from ..utils.validation import is_valid_uuid
+from ..utils.tool_flags import PROGRESS_ENABLED, info_logging_enabled
 
 logger = logging.getLogger("ping_mcp_server")
 
-def register_population_tools(server: FastMCP, ping_client: PingOneClient):
-    """Register all population-related tools with the MCP server."""
+# Seconds a list_pingone_populations response is served from cache
+_POP_CACHE_TTL_SECONDS = 60
+
+# Static note included in list_pingone_populations responses
+_USAGE_NOTE = "Use the 'id' field in list_pingone_users filter: 'population.id eq \"uuid\"'"
+
+# Fields returned by list_pingone_populations, with defaults for missing values
+_POP_FIELDS = ("id", "name", "description", "default", "userCount")
+_POP_DEFAULTS = {"description": "", "default": False, "userCount": 0}
+
+
+def _project_population(population: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a population to the key fields used for identification."""
+    return {field: population.get(field, _POP_DEFAULTS.get(field)) for field in _POP_FIELDS}
+
+class PopulationTools:
+    """Population-related MCP tools bound to a PingOne client."""
     
-    def is_valid_uuid(value: str) -> bool:
-        """Check if a string is a valid UUID format."""
-        uuid_pattern = re.compile(
-            r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', 
-            re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(value))
+    def __init__(self, ping_client: PingOneClient):
+        self.client = ping_client
+        
+        # list_pingone_populations responses keyed by environment: (monotonic timestamp, response)
+        self.population_list_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # get_pingone_population API results keyed by (environment, population_id, include_password_policy)
+        self.population_cache = AsyncTTLCache(maxsize=128, ttl=15)
+        
+        self.log_info = info_logging_enabled(logger)
     
-    @server.tool()
     async def list_pingone_populations(
+        self,
         environment: Annotated[str, Field(description="Environment name. Leave empty to use default from .env file")] = "",
+        force_refresh: Annotated[bool, Field(description="Bypass the short-lived population cache")] = False,
         ctx: Context | None = None
     ) -> Dict[str, Any]:
         """List all populations in the PingOne environment.
@@ -35,31 +58,54 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
         
         Populations typically represent organizational units like employees, 
         contractors, or external users.
+        
+        Results are cached for 60 seconds per environment. Set force_refresh=true
+        to fetch fresh data. If PingOne is unreachable, the last cached result is
+        returned with "stale": true.
         """
         try:
             # Add server-side tool logging
-            logger.info("Executing list_pingone_populations")
+            if self.log_info:
+                logger.info("Executing list_pingone_populations")
             if ctx:
                 await ctx.info("Executing list_pingone_populations")
-                await ctx.report_progress(20, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(20, 100)
             
             environment = environment.strip() if environment else ""
             
-            if ctx:
-                await ctx.report_progress(40, 100)
+            env_key = environment or "__default__"
+            cached = self.population_list_cache.get(env_key)
+            if cached and not force_refresh and time.monotonic() - cached[0] < _POP_CACHE_TTL_SECONDS:
+                logger.debug(f"Serving cached populations for '{env_key}'")
+                if ctx and PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
+                return cached[1]
             
-            result = await ping_client.get(
-                endpoint="populations",
-                query_params=None,
-                environment=environment,
-                paginated=True,
-                page_size=100
-            )
+            if ctx and PROGRESS_ENABLED:
+                await ctx.report_progress(40, 100)
             
-            if ctx:
+            try:
+                result = await self.client.get(
+                    endpoint="populations",
+                    query_params=None,
+                    environment=environment,
+                    paginated=True,
+                    page_size=100
+                )
+            except Exception as e:
+                if cached:
+                    logger.warning(f"Population fetch failed, serving stale cache for '{env_key}': {e}")
+                    return {**cached[1], "stale": True}
+                raise
+            
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(80, 100)
             
             if not result["success"]:
+                if cached:
+                    logger.warning(f"Population fetch failed, serving stale cache for '{env_key}'")
+                    return {**cached[1], "stale": True}
                 error_msg = f"PingOne API error: {result.get('error', 'Unknown error')}"
                 if ctx:
                     await ctx.error(error_msg)
@@ -69,30 +115,24 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
             env_info = result.get("environment", {})
             
             # Extract key fields for easy identification
-            simplified_populations = []
-            for pop in populations:
-                simplified_pop = {
-                    "id": pop.get("id"),
-                    "name": pop.get("name"),
-                    "description": pop.get("description", ""),
-                    "default": pop.get("default", False),
-                    "userCount": pop.get("userCount", 0)
-                }
-                simplified_populations.append(simplified_pop)
+            simplified_populations = [_project_population(pop) for pop in populations]
             
             if ctx:
                 await ctx.info(f"Retrieved {len(populations)} populations")
-                await ctx.report_progress(100, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
             
-            return {
+            response = {
                 "success": True,
                 "populations": simplified_populations,
                 "environment": env_info,
                 "summary": {
                     "total_count": len(populations),
-                    "usage_note": "Use the 'id' field in list_pingone_users filter: 'population.id eq \"uuid\"'"
+                    "usage_note": _USAGE_NOTE
                 }
             }
+            self.population_list_cache[env_key] = (time.monotonic(), response)
+            return response
             
         except ToolError:
             raise
@@ -102,8 +142,8 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
             logger.exception("Error in list_pingone_populations")
             raise ToolError(f"Unexpected error: {str(e)}")
     
-    @server.tool()
     async def get_pingone_population(
+        self,
         population_id: Annotated[str, Field(description="Population UUID from list_pingone_populations")],
         include_password_policy: Annotated[bool, Field(description="Include password policy details")] = False,
         environment: Annotated[str, Field(description="Environment name. Leave empty to use default from .env file")] = "",
@@ -115,12 +155,6 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
         population configuration including user count, password policies, and settings.
         """
         try:
-            # Add server-side tool logging
-            logger.info("Executing get_pingone_population")
-            if ctx:
-                await ctx.info("Executing get_pingone_population")
-                await ctx.report_progress(15, 100)
-            
             population_id = population_id.strip()
             environment = environment.strip() if environment else ""
             
@@ -128,41 +162,49 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
             if not is_valid_uuid(population_id):
                 raise ToolError(f"Invalid UUID format: {population_id}. Use list_pingone_populations to find correct UUID.")
             
+            # Add server-side tool logging
+            if self.log_info:
+                logger.info("Executing get_pingone_population")
+            if ctx:
+                await ctx.info("Executing get_pingone_population")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(15, 100)
+            
             query_params = {}
             if include_password_policy:
                 query_params["include"] = "passwordPolicy"
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(40, 100)
             
-            result = await ping_client.get(
-                endpoint=f"populations/{population_id}",
-                query_params=query_params if query_params else None,
-                environment=environment,
-                paginated=False
+            result = await self.population_cache.get_or_load(
+                (environment, population_id, include_password_policy),
+                lambda: self.client.get(
+                    endpoint=f"populations/{population_id}",
+                    query_params=query_params if query_params else None,
+                    environment=environment,
+                    paginated=False
+                ),
+                cache_if=lambda r: r["success"]
             )
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(75, 100)
             
             if not result["success"]:
-                error_details = result.get('error', 'Population not found')
-                
-                if "400" in str(error_details) or "INVALID_REQUEST" in str(error_details):
-                    raise ToolError(f"Invalid population ID. Use list_pingone_populations to find correct UUID.")
-                elif "404" in str(error_details):
-                    raise ToolError(f"Population {population_id} not found.")
-                elif "403" in str(error_details):
-                    raise ToolError(f"Access denied for population {population_id}.")
-                else:
-                    raise ToolError(f"API error: {error_details}")
+                raise_api_error(result.get('error', 'Population not found'), {
+                    "400": "Invalid population ID. Use list_pingone_populations to find correct UUID.",
+                    "404": f"Population {population_id} not found.",
+                    "403": f"Access denied for population {population_id}."
+                })
             
             population = result["item"]
             env_info = result.get("environment", {})
             
             if ctx:
                 await ctx.info(f"Retrieved population data for {population_id}")
-                await ctx.report_progress(100, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
             
             return {
                 "success": True,
@@ -183,5 +225,12 @@ def register_population_tools(server: FastMCP, ping_client: PingOneClient):
                 await ctx.error(f"Error getting population {population_id}: {str(e)}")
             logger.exception(f"Error in get_pingone_population for {population_id}")
             raise ToolError(f"Unexpected error: {str(e)}")
+
+
+def register_population_tools(server: FastMCP, ping_client: PingOneClient):
+    """Register all population-related tools with the MCP server."""
+    tools = PopulationTools(ping_client)
+    server.tool()(tools.list_pingone_populations)
+    server.tool()(tools.get_pingone_population)
     
     logger.info("Registered PingOne population management tools")
\ No newline at end of file
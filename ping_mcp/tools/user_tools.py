@@ -1,30 +1,100 @@
 """User management tools for PingOne MCP server."""
 
+import asyncio
 import logging
-import re
-from typing import List, Dict, Any, Optional, Union, Annotated, Literal
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union, Annotated, Literal
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from ..utils.ping_client import PingOneClient
 from ..utils.normalize_ping_responses import PingOneResponseHandler
+from ..utils.error_handling import raise_api_error
+from ..utils.ttl_cache import AsyncTTLCache
+from ..utils.validation import is_valid_uuid
+from ..utils.tool_flags import PROGRESS_ENABLED, info_logging_enabled
 
 logger = logging.getLogger("ping_mcp_server")
 
-def register_user_tools(server: FastMCP, ping_client: PingOneClient):
-    """Register all user-related tools with the MCP server."""
+# Field selections per detail_level, shared by list and get tools
+_DETAIL_FIELDS = {
+    "basic": (
+        "id", "username", "email", "enabled", "name.given", "name.family", "lifecycle.status"
+    ),
+    "detailed": (
+        "id", "username", "email", "enabled", "createdAt", "updatedAt",
+        "name.given", "name.family", "name.formatted",
+        "lifecycle.status", "account.status", "account.canAuthenticate",
+        "population.id", "mfaEnabled", "verifyStatus"
+    ),
+    "contact": (
+        "id", "username", "email", "mobilePhone", "primaryPhone",
+        "name.given", "name.family", "address"
+    ),
+}
+
+# Extra fields preserved in get_pingone_user when expansions are requested
+_GROUP_FIELDS = ("memberOfGroupNames", "memberOfGroupIDs")
+_POP_FIELDS = ("_embedded.population", "population")
+
+# Static notes included in tool responses
+_SCIM_LIMIT_NOTE = "PingOne SCIM does not support filtering by createdAt/updatedAt timestamps"
+_MAX_SESSIONS_PER_USER = 10
+_SESSIONS_NOTE = f"Sessions ordered by date (newest first). Max {_MAX_SESSIONS_PER_USER} sessions per user."
+
+# Upper bound on user IDs accepted by get_pingone_users_batch
+_MAX_BATCH_USERS = 100
+
+
+@lru_cache(maxsize=32)
+def _build_projector(include_fields: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build a function that keeps only include_fields from a user dict.
+    
+    Dotted paths such as "name.given" are compiled once here with
+    PingOneResponseHandler.compile_fields instead of once per user.
+    """
+    paths = PingOneResponseHandler.compile_fields(include_fields)
+    
+    def project(item: Dict[str, Any]) -> Dict[str, Any]:
+        return PingOneResponseHandler.filter_response_fields(item, paths)
     
-    def is_valid_uuid(value: str) -> bool:
-        """Check if a string is a valid UUID format."""
-        uuid_pattern = re.compile(
-            r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', 
-            re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(value))
+    return project
+
+
+_PROJECTORS = {level: _build_projector(fields) for level, fields in _DETAIL_FIELDS.items()}
+
+# Shared read-only default for missing nested objects
+_EMPTY: Dict[str, Any] = {}
+
+
+def _project_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a session to the basic fields returned when include_details=False."""
+    last_sign_on = session.get("lastSignOn") or _EMPTY
+    return {
+        "id": session.get("id"),
+        "createdAt": session.get("createdAt"),
+        "activeAt": session.get("activeAt"),
+        "lastSignOn": {
+            "at": last_sign_on.get("at"),
+            "remoteIp": last_sign_on.get("remoteIp")
+        }
+    }
+
+class UserTools:
+    """User-related MCP tools bound to a PingOne client."""
+    
+    def __init__(self, ping_client: PingOneClient):
+        self.client = ping_client
+        
+        # Raw user API results keyed by (environment, user_id, include_groups, expand_population);
+        # detail_level filtering happens after the lookup so it is not part of the key
+        self.user_cache = AsyncTTLCache(maxsize=128, ttl=15)
+        
+        self.log_info = info_logging_enabled(logger)
     
-    @server.tool()
     async def list_pingone_users(
+        self,
         limit: Annotated[int, Field(ge=1, le=100)] = 100,
         population_id: Annotated[str, Field(description="Population UUID filter")] = "",
         filter_by: Annotated[str, Field(description="SCIM filter expression. See docstring for complete syntax.")] = "",
@@ -83,72 +153,65 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
         """
         try:
             # Add server-side tool logging
-            logger.info("SERVER: Executing list_pingone_users")
+            if self.log_info:
+                logger.info("SERVER: Executing list_pingone_users")
             if ctx:
                 await ctx.info("Executing list_pingone_users")
-                await ctx.report_progress(10, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(10, 100)
             
             query_params = {}
-            filters = []
-            if population_id and population_id.strip():
-                filters.append(f'population.id eq "{population_id.strip()}"')
-            if filter_by and filter_by.strip():
-                filters.append(filter_by.strip())
+            population_id = population_id.strip() if population_id else ""
+            filter_by = filter_by.strip() if filter_by else ""
             
-            if filters:
-                query_params["filter"] = " and ".join(filters)
+            if population_id and filter_by:
+                query_params["filter"] = f'population.id eq "{population_id}" and {filter_by}'
+            elif population_id:
+                query_params["filter"] = f'population.id eq "{population_id}"'
+            elif filter_by:
+                query_params["filter"] = filter_by
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(30, 100)
             
-            result = await ping_client.get(
+            project = _PROJECTORS.get(detail_level)
+            users = []
+            has_more = False
+            env_info = {}
+            
+            # Project users as pages arrive and stop once the limit is reached.
+            # page_size == limit, so the first page is usually the last one needed:
+            # no prefetch, which would spend a request on a page that gets discarded.
+            async for page in self.client.paginate(
                 endpoint="users",
                 query_params=query_params if query_params else None,
                 environment=environment,
-                paginated=True,
-                page_size=limit
-            )
-            
-            if ctx:
-                await ctx.report_progress(70, 100)
-            
-            if not result["success"]:
-                error_msg = f"PingOne API error: {result.get('error', 'Unknown error')}"
-                if ctx:
-                    await ctx.error(error_msg)
-                raise ToolError(error_msg)
-            
-            users = result["items"]
-            
-            # Apply field filtering based on detail level
-            include_fields = None
-            if detail_level == "basic":
-                include_fields = ["id", "username", "email", "enabled", "name.given", "name.family", "lifecycle.status"]
-            elif detail_level == "detailed":
-                include_fields = [
-                    "id", "username", "email", "enabled", "createdAt", "updatedAt",
-                    "name.given", "name.family", "name.formatted",
-                    "lifecycle.status", "account.status", "account.canAuthenticate",
-                    "population.id", "mfaEnabled", "verifyStatus"
-                ]
-            elif detail_level == "contact":
-                include_fields = [
-                    "id", "username", "email", "mobilePhone", "primaryPhone",
-                    "name.given", "name.family", "address"
-                ]
-            
-            if include_fields:
-                response_handler = PingOneResponseHandler()
-                users = [
-                    response_handler.filter_response_fields(user, include_fields)
-                    for user in users
-                ]
-            
-            env_info = result.get("environment", {})
+                page_size=limit,
+                prefetch=False
+            ):
+                if not page["success"]:
+                    error_msg = f"PingOne API error: {page.get('error', 'Unknown error')}"
+                    if ctx:
+                        await ctx.error(error_msg)
+                    raise ToolError(error_msg)
+                
+                env_info = page.get("environment", env_info)
+                has_more = page["pagination"]["has_next"]
+                
+                for user in page["items"]:
+                    if len(users) >= limit:
+                        has_more = True
+                        break
+                    # Apply field filtering based on detail level
+                    users.append(project(user) if project else user)
+                
+                if len(users) >= limit:
+                    break
             
             if ctx:
                 await ctx.info(f"Retrieved {len(users)} users")
-                await ctx.report_progress(100, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
             
             return {
                 "success": True,
@@ -156,10 +219,10 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
                 "environment": env_info,
                 "summary": {
                     "returned_count": len(users),
-                    "has_more": result["pagination"]["has_next"],
+                    "has_more": has_more,
                     "detail_level": detail_level,
                     "filter_applied": query_params.get("filter", "none"),
-                    "scim_limitation": "PingOne SCIM does not support filtering by createdAt/updatedAt timestamps"
+                    "scim_limitation": _SCIM_LIMIT_NOTE
                 }
             }
             
@@ -171,8 +234,8 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             logger.exception("Error in list_pingone_users")
             raise ToolError(f"Unexpected error: {str(e)}")
     
-    @server.tool()
     async def get_pingone_user(
+        self,
         user_id: Annotated[str, Field(description="User UUID from list_pingone_users (format: 12345678-1234-1234-1234-123456789abc)")],
         detail_level: Annotated[Literal["basic", "detailed", "contact"], Field(description="basic=core fields, detailed=+lifecycle/MFA, contact=+phone/address")] = "",
         include_groups: Annotated[bool, Field(description="Include group memberships")] = False,
@@ -195,12 +258,6 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
         Set expand_population=true to get full population details instead of just ID.
         """
         try:
-            # Add server-side tool logging
-            logger.info("Executing get_pingone_user")
-            if ctx:
-                await ctx.info("Executing get_pingone_user")
-                await ctx.report_progress(15, 100)
-            
             user_id = user_id.strip()
             environment = environment.strip() if environment else ""
             
@@ -208,6 +265,14 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             if not is_valid_uuid(user_id):
                 raise ToolError(f"Invalid UUID format: {user_id}. Use list_pingone_users to find correct UUID.")
             
+            # Add server-side tool logging
+            if self.log_info:
+                logger.info("Executing get_pingone_user")
+            if ctx:
+                await ctx.info("Executing get_pingone_user")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(15, 100)
+            
             query_params = {}
             
             # Build query parameters
@@ -223,64 +288,48 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             if expand_params:
                 query_params["expand"] = ",".join(expand_params)
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(40, 100)
             
-            result = await ping_client.get(
-                endpoint=f"users/{user_id}",
-                query_params=query_params if query_params else None,
-                environment=environment,
-                paginated=False
+            result = await self.user_cache.get_or_load(
+                (environment, user_id, include_groups, expand_population),
+                lambda: self.client.get(
+                    endpoint=f"users/{user_id}",
+                    query_params=query_params if query_params else None,
+                    environment=environment,
+                    paginated=False
+                ),
+                cache_if=lambda r: r["success"]
             )
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(75, 100)
             
             if not result["success"]:
-                error_details = result.get('error', 'User not found')
-                
-                if "400" in str(error_details) or "INVALID_REQUEST" in str(error_details):
-                    raise ToolError(f"Invalid user ID. Use list_pingone_users to find correct UUID.")
-                elif "404" in str(error_details):
-                    raise ToolError(f"User {user_id} not found.")
-                elif "403" in str(error_details):
-                    raise ToolError(f"Access denied for user {user_id}.")
-                else:
-                    raise ToolError(f"API error: {error_details}")
+                raise_api_error(result.get('error', 'User not found'), {
+                    "400": "Invalid user ID. Use list_pingone_users to find correct UUID.",
+                    "404": f"User {user_id} not found.",
+                    "403": f"Access denied for user {user_id}."
+                })
             
             user = result["item"]
             env_info = result.get("environment", {})
             
             # Apply field filtering
-            include_fields = None
-            if detail_level == "basic":
-                include_fields = ["id", "username", "email", "enabled", "name.given", "name.family", "lifecycle.status"]
-            elif detail_level == "detailed":
-                include_fields = [
-                    "id", "username", "email", "enabled", "createdAt", "updatedAt",
-                    "name.given", "name.family", "name.formatted",
-                    "lifecycle.status", "account.status", "account.canAuthenticate",
-                    "population.id", "mfaEnabled", "verifyStatus"
-                ]
-            elif detail_level == "contact":
-                include_fields = [
-                    "id", "username", "email", "mobilePhone", "primaryPhone",
-                    "name.given", "name.family", "address"
-                ]
-            
-            if include_fields:
-                response_handler = PingOneResponseHandler()
+            if detail_level in _DETAIL_FIELDS:
                 # Preserve expanded data
-                if include_groups:
-                    include_fields.extend(["memberOfGroupNames", "memberOfGroupIDs"])
-                if expand_population:
-                    include_fields.extend(["_embedded.population", "population"])
+                include_fields = (
+                    _DETAIL_FIELDS[detail_level]
+                    + (_GROUP_FIELDS if include_groups else ())
+                    + (_POP_FIELDS if expand_population else ())
+                )
                 
-                user = response_handler.filter_response_fields(user, include_fields)
+                user = _build_projector(include_fields)(user)
             
             if ctx:
                 await ctx.info(f"Retrieved user data for {user_id}")
-                await ctx.report_progress(100, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
             
             return {
                 "success": True,
@@ -304,9 +353,272 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             logger.exception(f"Error in get_pingone_user for {user_id}")
             raise ToolError(f"Unexpected error: {str(e)}")
 
+    async def get_pingone_users_batch(
+        self,
+        user_ids: Annotated[List[str], Field(description="User UUIDs from list_pingone_users (max 100)")],
+        detail_level: Annotated[Literal["basic", "detailed", "contact"], Field(description="basic=core fields, detailed=+lifecycle/MFA, contact=+phone/address")] = "",
+        include_groups: Annotated[bool, Field(description="Include group memberships")] = False,
+        expand_population: Annotated[bool, Field(description="Include population details")] = False,
+        max_concurrency: Annotated[int, Field(ge=1, le=20, description="Maximum parallel requests to PingOne")] = 8,
+        environment: Annotated[str, Field(description="Environment name. Leave empty to use default from .env file")] = "",
+        ctx: Context | None = None
+    ) -> Dict[str, Any]:
+        """Get several users by UUID in one call.
+        
+        Prefer this over repeated get_pingone_user calls when you already have a list
+        of user UUIDs (up to 100), e.g. from list_pingone_users results. Users are
+        fetched concurrently and accept the same detail_level, include_groups and
+        expand_population options as get_pingone_user.
+        
+        Partial failures do not fail the whole call: users that could not be fetched
+        are listed under "errors" with the reason.
+        """
+        try:
+            if self.log_info:
+                logger.info("Executing get_pingone_users_batch")
+            if ctx:
+                await ctx.info("Executing get_pingone_users_batch")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(10, 100)
+            
+            # Strip and de-duplicate while preserving order
+            user_ids = list(dict.fromkeys(uid.strip() for uid in user_ids if uid and uid.strip()))
+            environment = environment.strip() if environment else ""
+            
+            if not user_ids:
+                raise ToolError("No user IDs provided. Use list_pingone_users to find user UUIDs.")
+            if len(user_ids) > _MAX_BATCH_USERS:
+                raise ToolError(f"Too many user IDs ({len(user_ids)}). Maximum is {_MAX_BATCH_USERS} per call.")
+            
+            invalid_ids = [uid for uid in user_ids if not is_valid_uuid(uid)]
+            if invalid_ids:
+                raise ToolError(f"Invalid UUID format: {', '.join(invalid_ids)}. Use list_pingone_users to find correct UUIDs.")
+            
+            query_params = {}
+            if include_groups:
+                query_params["include"] = ",".join(_GROUP_FIELDS)
+            if expand_population:
+                query_params["expand"] = "populations"
+            
+            project = None
+            if detail_level in _DETAIL_FIELDS:
+                project = _build_projector(
+                    _DETAIL_FIELDS[detail_level]
+                    + (_GROUP_FIELDS if include_groups else ())
+                    + (_POP_FIELDS if expand_population else ())
+                )
+            
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def fetch_user(uid: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.user_cache.get_or_load(
+                        (environment, uid, include_groups, expand_population),
+                        lambda: self.client.get(
+                            endpoint=f"users/{uid}",
+                            query_params=query_params if query_params else None,
+                            environment=environment,
+                            paginated=False
+                        ),
+                        cache_if=lambda r: r["success"]
+                    )
+            
+            if ctx and PROGRESS_ENABLED:
+                await ctx.report_progress(30, 100)
+            
+            results = await asyncio.gather(
+                *(fetch_user(uid) for uid in user_ids),
+                return_exceptions=True
+            )
+            
+            if ctx and PROGRESS_ENABLED:
+                await ctx.report_progress(80, 100)
+            
+            users = []
+            errors = []
+            env_info = {}
+            for uid, result in zip(user_ids, results):
+                if isinstance(result, BaseException):
+                    errors.append({"user_id": uid, "error": str(result)})
+                    continue
+                if not result["success"]:
+                    errors.append({"user_id": uid, "error": str(result.get("error", "User not found"))})
+                    continue
+                
+                user = result["item"]
+                if project:
+                    user = project(user)
+                users.append(user)
+                env_info = result.get("environment", env_info)
+            
+            if ctx:
+                await ctx.info(f"Retrieved {len(users)} of {len(user_ids)} users")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
+            
+            return {
+                "success": bool(users) or not errors,
+                "users": users,
+                "errors": errors,
+                "environment": env_info,
+                "detail_level": detail_level,
+                "summary": {
+                    "requested_count": len(user_ids),
+                    "returned_count": len(users),
+                    "failed_count": len(errors)
+                }
+            }
+        
+        except ToolError:
+            raise
+        except Exception as e:
+            if ctx:
+                await ctx.error(f"Error getting users batch: {str(e)}")
+            logger.exception("Error in get_pingone_users_batch")
+            raise ToolError(f"Unexpected error: {str(e)}")
+
+    async def get_pingone_user_with_population(
+        self,
+        user_id: Annotated[str, Field(description="User UUID from list_pingone_users (format: 12345678-1234-1234-1234-123456789abc)")],
+        population_id: Annotated[str, Field(description="User's population UUID if already known; fetched in parallel with the user")] = "",
+        detail_level: Annotated[Literal["basic", "detailed", "contact"], Field(description="basic=core fields, detailed=+lifecycle/MFA, contact=+phone/address")] = "",
+        include_groups: Annotated[bool, Field(description="Include group memberships")] = False,
+        environment: Annotated[str, Field(description="Environment name. Leave empty to use default from .env file")] = "",
+        ctx: Context | None = None
+    ) -> Dict[str, Any]:
+        """Get a user together with full details of their population.
+        
+        Use this instead of get_pingone_user followed by get_pingone_population.
+        If population_id is supplied (e.g. from list_pingone_users detailed results),
+        the user and population are fetched concurrently; otherwise the population
+        is looked up from the user's population.id.
+        
+        A failed population lookup does not fail the call: population is null and
+        population_error explains why.
+        """
+        try:
+            user_id = user_id.strip()
+            population_id = population_id.strip() if population_id else ""
+            environment = environment.strip() if environment else ""
+            
+            if not is_valid_uuid(user_id):
+                raise ToolError(f"Invalid UUID format: {user_id}. Use list_pingone_users to find correct UUID.")
+            if population_id and not is_valid_uuid(population_id):
+                raise ToolError(f"Invalid population UUID format: {population_id}. Use list_pingone_populations to find correct UUID.")
+            
+            if self.log_info:
+                logger.info("Executing get_pingone_user_with_population")
+            if ctx:
+                await ctx.info("Executing get_pingone_user_with_population")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(15, 100)
+            
+            query_params = {"include": ",".join(_GROUP_FIELDS)} if include_groups else None
+            
+            def fetch_user():
+                return self.user_cache.get_or_load(
+                    (environment, user_id, include_groups, False),
+                    lambda: self.client.get(
+                        endpoint=f"users/{user_id}",
+                        query_params=query_params,
+                        environment=environment,
+                        paginated=False
+                    ),
+                    cache_if=lambda r: r["success"]
+                )
+            
+            def fetch_population(pop_id: str):
+                return self.client.get(
+                    endpoint=f"populations/{pop_id}",
+                    query_params=None,
+                    environment=environment,
+                    paginated=False
+                )
+            
+            pop_result = None
+            if population_id:
+                user_result, pop_result = await asyncio.gather(
+                    fetch_user(),
+                    fetch_population(population_id),
+                    return_exceptions=True
+                )
+                if isinstance(user_result, BaseException):
+                    raise user_result
+            else:
+                user_result = await fetch_user()
+            
+            if ctx and PROGRESS_ENABLED:
+                await ctx.report_progress(60, 100)
+            
+            if not user_result["success"]:
+                raise_api_error(user_result.get('error', 'User not found'), {
+                    "400": "Invalid user ID. Use list_pingone_users to find correct UUID.",
+                    "404": f"User {user_id} not found.",
+                    "403": f"Access denied for user {user_id}."
+                })
+            
+            user = user_result["item"]
+            env_info = user_result.get("environment", {})
+            
+            # Only the user's own population is returned: refetch when none (or the
+            # wrong one) was given, and drop the caller's when the user has none
+            user_population_id = (user.get("population") or {}).get("id")
+            if not user_population_id:
+                pop_result = None
+            elif user_population_id != population_id:
+                try:
+                    pop_result = await fetch_population(user_population_id)
+                except Exception as e:
+                    pop_result = e
+            
+            population = None
+            population_error = None
+            if pop_result is None:
+                population_error = "User has no population assigned."
+            elif isinstance(pop_result, BaseException):
+                population_error = str(pop_result)
+            elif not pop_result["success"]:
+                population_error = str(pop_result.get("error", "Population not found"))
+            else:
+                population = pop_result["item"]
+            
+            if detail_level in _DETAIL_FIELDS:
+                user = _build_projector(
+                    _DETAIL_FIELDS[detail_level] + (_GROUP_FIELDS if include_groups else ())
+                )(user)
+            
+            if ctx:
+                await ctx.info(f"Retrieved user and population data for {user_id}")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
+            
+            response = {
+                "success": True,
+                "user": user,
+                "population": population,
+                "environment": env_info,
+                "detail_level": detail_level,
+                "included_data": {
+                    "groups": include_groups
+                }
+            }
+            if population_error:
+                response["population_error"] = population_error
+            return response
+        
+        except ToolError:
+            raise
+        except Exception as e:
+            if 'rate limit' in str(e).lower():
+                raise ToolError('Rate limit exceeded. Wait and retry.')
             
-    @server.tool()
+            if ctx:
+                await ctx.error(f"Error getting user {user_id} with population: {str(e)}")
+            logger.exception(f"Error in get_pingone_user_with_population for {user_id}")
+            raise ToolError(f"Unexpected error: {str(e)}")
+
     async def get_pingone_user_sessions(
+        self,
         user_id: Annotated[str, Field(description="User UUID to get sessions for (from list_pingone_users)")],
         include_details: Annotated[bool, Field(description="Include browser, OS, device, and location details")] = True,
         environment: Annotated[str, Field(description="Environment name. Leave empty to use default from .env file")] = "",
@@ -322,12 +634,6 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
         Useful for security analysis, user activity monitoring, and session management.
         """
         try:
-            # Add server-side tool logging
-            logger.info("Executing get_pingone_user_sessions")
-            if ctx:
-                await ctx.info("Executing get_pingone_user_sessions")
-                await ctx.report_progress(15, 100)
-            
             user_id = user_id.strip()
             environment = environment.strip() if environment else ""
             
@@ -335,30 +641,30 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             if not is_valid_uuid(user_id):
                 raise ToolError(f"Invalid UUID format: {user_id}. Use list_pingone_users to find correct UUID.")
             
+            # Add server-side tool logging
+            if self.log_info:
+                logger.info("Executing get_pingone_user_sessions")
             if ctx:
-                await ctx.report_progress(40, 100)
+                await ctx.info("Executing get_pingone_user_sessions")
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(40, 100)
             
-            result = await ping_client.get(
+            result = await self.client.get(
                 endpoint=f"users/{user_id}/sessions",
                 query_params=None,
                 environment=environment,
                 paginated=False
             )
             
-            if ctx:
+            if ctx and PROGRESS_ENABLED:
                 await ctx.report_progress(75, 100)
             
             if not result["success"]:
-                error_details = result.get('error', 'Sessions not found')
-                
-                if "400" in str(error_details) or "INVALID_REQUEST" in str(error_details):
-                    raise ToolError(f"Invalid user ID. Use list_pingone_users to find correct UUID.")
-                elif "404" in str(error_details):
-                    raise ToolError(f"User {user_id} not found or has no sessions.")
-                elif "403" in str(error_details):
-                    raise ToolError(f"Access denied for user {user_id} sessions.")
-                else:
-                    raise ToolError(f"API error: {error_details}")
+                raise_api_error(result.get('error', 'Sessions not found'), {
+                    "400": "Invalid user ID. Use list_pingone_users to find correct UUID.",
+                    "404": f"User {user_id} not found or has no sessions.",
+                    "403": f"Access denied for user {user_id} sessions."
+                })
             
             # Extract sessions from _embedded.sessions
             sessions_data = result.get("item", {})
@@ -368,25 +674,14 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             # Apply field filtering based on include_details
             if not include_details:
                 # Basic session info only
-                simplified_sessions = []
-                for session in sessions:
-                    simplified_session = {
-                        "id": session.get("id"),
-                        "createdAt": session.get("createdAt"),
-                        "activeAt": session.get("activeAt"),
-                        "lastSignOn": {
-                            "at": session.get("lastSignOn", {}).get("at"),
-                            "remoteIp": session.get("lastSignOn", {}).get("remoteIp")
-                        }
-                    }
-                    simplified_sessions.append(simplified_session)
-                sessions = simplified_sessions
+                sessions = [_project_session(session) for session in sessions]
             
             session_count = len(sessions)
             
             if ctx:
                 await ctx.info(f"Retrieved {session_count} sessions for user {user_id}")
-                await ctx.report_progress(100, 100)
+                if PROGRESS_ENABLED:
+                    await ctx.report_progress(100, 100)
             
             return {
                 "success": True,
@@ -395,9 +690,9 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
                 "environment": env_info,
                 "summary": {
                     "session_count": session_count,
-                    "max_sessions_per_user": 10,
+                    "max_sessions_per_user": _MAX_SESSIONS_PER_USER,
                     "details_included": include_details,
-                    "note": "Sessions ordered by date (newest first). Max 10 sessions per user."
+                    "note": _SESSIONS_NOTE
                 }
             }
             
@@ -410,6 +705,16 @@ def register_user_tools(server: FastMCP, ping_client: PingOneClient):
             if ctx:
                 await ctx.error(f"Error getting sessions for user {user_id}: {str(e)}")
             logger.exception(f"Error in get_pingone_user_sessions for {user_id}")
-            raise ToolError(f"Unexpected error: {str(e)}")              
+            raise ToolError(f"Unexpected error: {str(e)}")
+
+
+def register_user_tools(server: FastMCP, ping_client: PingOneClient):
+    """Register all user-related tools with the MCP server."""
+    tools = UserTools(ping_client)
+    server.tool()(tools.list_pingone_users)
+    server.tool()(tools.get_pingone_user)
+    server.tool()(tools.get_pingone_users_batch)
+    server.tool()(tools.get_pingone_user_with_population)
+    server.tool()(tools.get_pingone_user_sessions)
     
     logger.info("Registered PingOne user management tools")
\ No newline at end of file
@@ -2,30 +2,76 @@
 OAuth2 authentication manager for PingOne API access.
 """
 
+import asyncio
 import base64
+import hashlib
+import logging
 import time
 from typing import Optional, Dict, Any
 import httpx
 from dataclasses import dataclass
 
-@dataclass
+from .json_utils import parse_response_json
+
+logger = logging.getLogger("ping_mcp_server")
+
+# Tokens are never trusted for longer than this, whatever expires_in says
+_TOKEN_TTL_CAP_SECONDS = 55 * 60
+
+@dataclass(slots=True, frozen=True)
 class TokenInfo:
     """OAuth2 token information."""
     access_token: str
     token_type: str
-    expires_at: float
+    expires_at: float  # time.monotonic() deadline
     scope: Optional[str] = None
 
+# Process-wide token state keyed by AuthManager._cache_key, so managers created
+# for the same credentials share one token and one in-flight refresh
+_TOKEN_CACHE: Dict[str, TokenInfo] = {}
+_REFRESH_TASKS: Dict[str, asyncio.Task] = {}
+
 class AuthManager:
     """Manages OAuth2 authentication with PingOne."""
     
-    def __init__(self, auth_base_url: str, env_id: str, client_id: str, client_secret: str):
+    def __init__(self, auth_base_url: str, env_id: str, client_id: str, client_secret: str,
+                 http_client: httpx.AsyncClient):
         self.auth_base_url = auth_base_url
         self.env_id = env_id
         self.client_id = client_id
         self.client_secret = client_secret
-        self.token_info: Optional[TokenInfo] = None
+        self._cache_key = hashlib.sha256(f"{auth_base_url}:{env_id}:{client_id}".encode()).hexdigest()
+        
+        # Token request inputs never change after construction, so build them once
+        self._token_url = f"{auth_base_url}/{env_id}/as/token"
+        self._token_headers = {
+            "Authorization": self._create_basic_auth_header(),
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        self._token_data = {
+            "grant_type": "client_credentials"
+        }
         self.token_buffer_seconds = 60  # Refresh token 60 seconds before expiry
+        self.stale_buffer_seconds = 180  # Start background refresh 180 seconds before expiry
+        
+        # Authorization header built for the token it was built from
+        self._auth_header: Dict[str, str] = {}
+        self._auth_header_token: Optional[TokenInfo] = None
+        
+        # Pool shared with API traffic; PingOneClient owns and closes it
+        self._client = http_client
+    
+    @property
+    def token_info(self) -> Optional[TokenInfo]:
+        """Current token for these credentials, shared across managers."""
+        return _TOKEN_CACHE.get(self._cache_key)
+    
+    @token_info.setter
+    def token_info(self, value: Optional[TokenInfo]) -> None:
+        if value is None:
+            _TOKEN_CACHE.pop(self._cache_key, None)
+        else:
+            _TOKEN_CACHE[self._cache_key] = value
     
     def _create_basic_auth_header(self) -> str:
         """Create Basic auth header for client credentials."""
@@ -35,61 +81,105 @@ class AuthManager:
     
     async def _request_token(self) -> TokenInfo:
         """Request a new access token using client credentials flow."""
-        token_url = f"{self.auth_base_url}/{self.env_id}/as/token"
+        response = await self._client.post(
+            self._token_url,
+            headers=self._token_headers,
+            data=self._token_data
+        )
         
-        headers = {
-            "Authorization": self._create_basic_auth_header(),
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        if response.status_code != 200:
+            error_detail = ""
+            try:
+                error_info = response.json()
+                error_detail = f": {error_info.get('error_description', error_info.get('error', ''))}"
+            except:
+                error_detail = f": HTTP {response.status_code}"
+            
+            raise Exception(f"Token request failed{error_detail}")
         
-        data = {
-            "grant_type": "client_credentials"
-        }
+        token_data = parse_response_json(response)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, headers=headers, data=data)
-            
-            if response.status_code != 200:
-                error_detail = ""
-                try:
-                    error_info = response.json()
-                    error_detail = f": {error_info.get('error_description', error_info.get('error', ''))}"
-                except:
-                    error_detail = f": HTTP {response.status_code}"
-                
-                raise Exception(f"Token request failed{error_detail}")
-            
-            token_data = response.json()
-            
-            # Calculate expiry time
-            expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
-            expires_at = time.time() + expires_in
-            
-            return TokenInfo(
-                access_token=token_data["access_token"],
-                token_type=token_data.get("token_type", "Bearer"),
-                expires_at=expires_at,
-                scope=token_data.get("scope")
-            )
+        # Calculate expiry time
+        expires_in = min(token_data.get("expires_in", 3600), _TOKEN_TTL_CAP_SECONDS)  # Default 1 hour
+        expires_at = time.monotonic() + expires_in
+        
+        return TokenInfo(
+            access_token=token_data["access_token"],
+            token_type=token_data.get("token_type", "Bearer"),
+            expires_at=expires_at,
+            scope=token_data.get("scope")
+        )
     
     def _is_token_expired(self) -> bool:
         """Check if current token is expired or about to expire."""
         if not self.token_info:
             return True
         
-        return time.time() >= (self.token_info.expires_at - self.token_buffer_seconds)
+        return time.monotonic() >= (self.token_info.expires_at - self.token_buffer_seconds)
+    
+    def _is_token_stale(self) -> bool:
+        """Check if current token is still usable but should be refreshed soon."""
+        return time.monotonic() >= (self.token_info.expires_at - self.stale_buffer_seconds)
+    
+    async def _refresh_token(self) -> TokenInfo:
+        """Request a new token, store it, and return it."""
+        token_info = await self._request_token()
+        self.token_info = token_info
+        return token_info
+    
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        """Log failed background refreshes so the exception is always retrieved."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Token refresh failed for environment {self.env_id}: {task.exception()}")
+    
+    def _start_refresh(self) -> "asyncio.Task[TokenInfo]":
+        """Start a token refresh unless one is already in flight for these credentials."""
+        task = _REFRESH_TASKS.get(self._cache_key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh_token())
+            task.add_done_callback(self._on_refresh_done)
+            _REFRESH_TASKS[self._cache_key] = task
+        return task
     
     async def get_access_token(self) -> str:
-        """Get a valid access token, refreshing if necessary."""
+        """
+        Get a valid access token, refreshing if necessary.
+        
+        Tokens move through three states:
+        - fresh: returned as-is
+        - stale (within stale_buffer_seconds of expiry): returned as-is while a
+          background refresh runs, so callers never wait on it
+        - expired (within token_buffer_seconds of expiry, or missing): callers
+          wait for the shared in-flight refresh
+        """
         if self._is_token_expired():
-            self.token_info = await self._request_token()
+            # Shielded: one cancelled waiter must not cancel the refresh the others share.
+            # Use the refreshed token itself; shared state may be invalidated meanwhile.
+            return (await asyncio.shield(self._start_refresh())).access_token
+        
+        token_info = self.token_info
+        if self._is_token_stale():
+            self._start_refresh()
         
-        return self.token_info.access_token
+        return token_info.access_token
     
     async def get_auth_header(self) -> Dict[str, str]:
-        """Get Authorization header for API requests."""
+        """
+        Get Authorization header for API requests.
+        
+        The header dict is rebuilt only when the token rotates; while the token is
+        fresh the cached dict is returned without going through get_access_token.
+        Callers must not mutate it.
+        """
+        token_info = self.token_info
+        if (token_info is not None and token_info is self._auth_header_token
+                and time.monotonic() < token_info.expires_at - self.stale_buffer_seconds):
+            return self._auth_header
+        
         token = await self.get_access_token()
-        return {"Authorization": f"Bearer {token}"}
+        self._auth_header_token = self.token_info
+        self._auth_header = {"Authorization": f"Bearer {token}"}
+        return self._auth_header
     
     def invalidate_token(self) -> None:
         """Invalidate current token to force refresh on next request."""
@@ -1,12 +1,23 @@
 import os
-import re
 import logging
-from dataclasses import dataclass
-from typing import Dict, Optional, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, List, Tuple
 
 logger = logging.getLogger("ping_mcp")
 
-@dataclass
+# Prefix of per-environment variables: PING_ENV_<n>_<FIELD>
+_ENV_PREFIX = "PING_ENV_"
+
+# Integer settings: (environment variable, PingOneConfig field, default, min, max)
+_INT_SETTINGS = (
+    ("PING_MAX_REQUESTS_PER_SECOND", "max_requests_per_second", 50, 1, 100),
+    ("PING_MAX_RETRIES", "max_retries", 3, 0, 10),
+    ("PING_REQUEST_TIMEOUT", "request_timeout", 30, 1, 300),
+    ("PING_DEFAULT_PAGE_SIZE", "default_page_size", 100, 1, 1000),
+    ("PING_MAX_PAGE_SIZE", "max_page_size", 1000, 1, 1000),
+)
+
+@dataclass(slots=True, frozen=True)
 class EnvironmentConfig:
     """Configuration for a single PingOne environment."""
     name: str
@@ -14,21 +25,23 @@ class EnvironmentConfig:
     client_id: str
     client_secret: str
     aliases: List[str]
+    # Lowercased forms used by matches(), computed once in __post_init__
+    name_lower: str = field(init=False, repr=False, compare=False)
+    aliases_lower: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "name_lower", self.name.lower())
+        object.__setattr__(self, "aliases_lower", frozenset(alias.lower() for alias in self.aliases))
     
     def matches(self, input_name: str) -> bool:
         """Check if this environment matches the given input (name or alias)."""
         input_lower = input_name.lower().strip()
         if not input_lower:
             return False
-            
-        # Check exact name match
-        if self.name.lower() == input_lower:
-            return True
-            
-        # Check alias matches
-        return any(alias.lower() == input_lower for alias in self.aliases)
+        
+        return input_lower == self.name_lower or input_lower in self.aliases_lower
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PingOneConfig:
     """Configuration for PingOne MCP server."""
     region: str
@@ -41,6 +54,11 @@ class PingOneConfig:
     request_timeout: int = 30
     default_page_size: int = 100
     max_page_size: int = 1000
+    # Lowercased name/alias -> environment name, built by ConfigManager.validate_config
+    _alias_index: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+# Parsed configuration shared by all load_config() callers
+_cached_config: Optional[PingOneConfig] = None
 
 class ConfigManager:
     """Manages configuration loading and validation."""
@@ -66,22 +84,28 @@ class ConfigManager:
         """Discover all environments from PING_ENV_N_* variables."""
         environments = {}
         
-        # Pattern to match PING_ENV_N_NAME variables
-        env_pattern = re.compile(r'^PING_ENV_(\d+)_NAME$')
-        
-        # Find all environment indices
-        env_indices = set()
-        for key in os.environ:
-            match = env_pattern.match(key)
-            if match:
-                env_indices.add(int(match.group(1)))
+        # Single pass over os.environ: bin PING_ENV_<n>_<FIELD> values by index
+        buckets: Dict[int, Dict[str, str]] = {}
+        prefix_len = len(_ENV_PREFIX)
+        for key, value in os.environ.items():
+            if not key.startswith(_ENV_PREFIX):
+                continue
+            sep = key.find("_", prefix_len)
+            if sep == -1:
+                continue
+            index_str = key[prefix_len:sep]
+            if not index_str.isdecimal():
+                continue
+            buckets.setdefault(int(index_str), {})[key[sep + 1:]] = value
         
-        logger.info(f"Found environment indices: {sorted(env_indices)}")
+        # An environment is defined by its PING_ENV_<n>_NAME variable
+        env_indices = sorted(index for index, values in buckets.items() if "NAME" in values)
+        logger.info(f"Found environment indices: {env_indices}")
         
         # Build environment configs
         for index in env_indices:
             try:
-                env_config = ConfigManager._build_environment_config(index)
+                env_config = ConfigManager._build_environment_config(index, buckets[index])
                 if env_config:
                     environments[env_config.name] = env_config
                     logger.info(f"Loaded environment: {env_config.name} (aliases: {env_config.aliases})")
@@ -92,15 +116,15 @@ class ConfigManager:
         return environments
     
     @staticmethod
-    def _build_environment_config(index: int) -> Optional[EnvironmentConfig]:
-        """Build environment config for a specific index."""
-        prefix = f"PING_ENV_{index}_"
+    def _build_environment_config(index: int, values: Dict[str, str]) -> Optional[EnvironmentConfig]:
+        """Build environment config for a specific index from its PING_ENV_<n>_* values (keyed by field suffix)."""
+        prefix = f"{_ENV_PREFIX}{index}_"
         
         # Required fields
-        name = os.getenv(f"{prefix}NAME")
-        env_id = os.getenv(f"{prefix}ID")
-        client_id = os.getenv(f"{prefix}CLIENT_ID")
-        client_secret = os.getenv(f"{prefix}CLIENT_SECRET")
+        name = values.get("NAME")
+        env_id = values.get("ID")
+        client_id = values.get("CLIENT_ID")
+        client_secret = values.get("CLIENT_SECRET")
         
         # Check required fields
         if not all([name, env_id, client_id, client_secret]):
@@ -114,7 +138,7 @@ class ConfigManager:
             return None
         
         # Optional aliases
-        aliases_str = os.getenv(f"{prefix}ALIAS", "")
+        aliases_str = values.get("ALIAS", "")
         aliases = [alias.strip() for alias in aliases_str.split(",") if alias.strip()] if aliases_str else []
         
         return EnvironmentConfig(
@@ -127,7 +151,26 @@ class ConfigManager:
     
     @staticmethod
     def load_config() -> PingOneConfig:
-        """Load configuration from environment variables."""
+        """
+        Load configuration from environment variables.
+        
+        The parsed configuration is cached for the life of the process;
+        call invalidate_config() to re-read the environment.
+        """
+        global _cached_config
+        if _cached_config is None:
+            _cached_config = ConfigManager._read_config()
+        return _cached_config
+    
+    @staticmethod
+    def invalidate_config() -> None:
+        """Drop the cached configuration so the next load_config() re-reads it."""
+        global _cached_config
+        _cached_config = None
+    
+    @staticmethod
+    def _read_config() -> PingOneConfig:
+        """Parse and validate configuration from environment variables."""
         
         # Required global settings
         region = os.getenv("PING_REGION")
@@ -163,11 +206,16 @@ class ConfigManager:
         
         # Optional settings with defaults
         env_type = os.getenv("PING_ENV_TYPE") or None
-        max_requests_per_second = int(os.getenv("PING_MAX_REQUESTS_PER_SECOND", "50"))
-        max_retries = int(os.getenv("PING_MAX_RETRIES", "3"))
-        request_timeout = int(os.getenv("PING_REQUEST_TIMEOUT", "30"))
-        default_page_size = int(os.getenv("PING_DEFAULT_PAGE_SIZE", "100"))
-        max_page_size = int(os.getenv("PING_MAX_PAGE_SIZE", "1000"))
+        int_settings: Dict[str, int] = {}
+        for env_var, field_name, default, _, _ in _INT_SETTINGS:
+            raw = os.getenv(env_var)
+            if raw is None:
+                int_settings[field_name] = default
+                continue
+            try:
+                int_settings[field_name] = int(raw)
+            except ValueError:
+                raise ValueError(f"{env_var} must be an integer, got '{raw}'") from None
         
         config = PingOneConfig(
             region=region,
@@ -175,11 +223,7 @@ class ConfigManager:
             default_env=default_env,
             environments=environments,
             env_type=env_type,
-            max_requests_per_second=max_requests_per_second,
-            max_retries=max_retries,
-            request_timeout=request_timeout,
-            default_page_size=default_page_size,
-            max_page_size=max_page_size
+            **int_settings
         )
         
         # Validate configuration
@@ -195,45 +239,38 @@ class ConfigManager:
             valid_regions = list(ConfigManager.REGION_URLS.keys())
             raise ValueError(f"Invalid region '{config.region}'. Valid regions: {valid_regions}")
         
-        # Validate rate limiting settings
-        if not 1 <= config.max_requests_per_second <= 100:
-            raise ValueError("max_requests_per_second must be between 1 and 100")
-        
-        if not 0 <= config.max_retries <= 10:
-            raise ValueError("max_retries must be between 0 and 10")
-        
-        if not 1 <= config.request_timeout <= 300:
-            raise ValueError("request_timeout must be between 1 and 300 seconds")
-        
-        if not 1 <= config.default_page_size <= 1000:
-            raise ValueError("default_page_size must be between 1 and 1000")
-        
-        if not 1 <= config.max_page_size <= 1000:
-            raise ValueError("max_page_size must be between 1 and 1000")
+        # Validate rate limiting, timeout and paging settings
+        for _, field_name, _, low, high in _INT_SETTINGS:
+            if not low <= getattr(config, field_name) <= high:
+                raise ValueError(f"{field_name} must be between {low} and {high}")
         
         if config.default_page_size > config.max_page_size:
             raise ValueError("default_page_size cannot be greater than max_page_size")
         
         # Validate environment names are unique
-        env_names = [env.name.lower() for env in config.environments.values()]
+        env_names = [env.name_lower for env in config.environments.values()]
         if len(env_names) != len(set(env_names)):
             raise ValueError("Environment names must be unique (case-insensitive)")
         
-        # Validate aliases don't conflict with environment names or other aliases
-        all_names_and_aliases = set()
-        for env in config.environments.values():
+        # Validate aliases don't conflict with environment names or other aliases,
+        # building the lookup index used by resolve_environment along the way
+        alias_index: Dict[str, str] = {}
+        for env_name, env in config.environments.items():
             # Check environment name
-            name_lower = env.name.lower()
-            if name_lower in all_names_and_aliases:
+            name_lower = env.name_lower
+            if name_lower in alias_index:
                 raise ValueError(f"Environment name '{env.name}' conflicts with another name or alias")
-            all_names_and_aliases.add(name_lower)
+            alias_index[name_lower] = env_name
             
             # Check aliases
             for alias in env.aliases:
                 alias_lower = alias.lower()
-                if alias_lower in all_names_and_aliases:
+                if alias_lower in alias_index:
                     raise ValueError(f"Alias '{alias}' in environment '{env.name}' conflicts with another name or alias")
-                all_names_and_aliases.add(alias_lower)
+                alias_index[alias_lower] = env_name
+        
+        # PingOneConfig is frozen; the index is derived state, so set it directly
+        object.__setattr__(config, "_alias_index", alias_index)
         
         logger.info("Configuration validation passed")
     
@@ -269,7 +306,12 @@ class ConfigManager:
             env_config = config.environments[env_name]
             return env_name, env_config
         
-        # Try to find matching environment
+        # Fast path: index built by validate_config
+        env_name = config._alias_index.get(environment_input.lower().strip())
+        if env_name is not None:
+            return env_name, config.environments[env_name]
+        
+        # Fall back to scanning, e.g. for configs that were never validated
         for env_name, env_config in config.environments.items():
             if env_config.matches(environment_input):
                 return env_name, env_config
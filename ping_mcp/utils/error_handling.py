@@ -1,11 +1,16 @@
 """Error handling utilities for Okta MCP server."""
 
 import logging
-from typing import Dict, Any, List, Union
+import re
+from typing import Dict, Any, List, NoReturn, Union
 from mcp.types import TextContent
+from fastmcp.exceptions import ToolError
 
 logger = logging.getLogger(__name__)
 
+# Error markers recognised in PingOne error details, see raise_api_error
+_API_ERROR_RE = re.compile(r'\b(400|403|404|INVALID_REQUEST)\b')
+
 def is_error_result(result: Any) -> bool:
     """Check if a result represents an error.
     
@@ -93,4 +98,24 @@ def handle_okta_result(result: Dict[str, Any], tool_name: str) -> Union[Any, Lis
         )
         return format_error_response(error, tool_name)
     
-    return result
\ No newline at end of file
+    return result
+
+
+def raise_api_error(error_details: Any, messages: Dict[str, str]) -> NoReturn:
+    """Raise a ToolError for a failed PingOne API result.
+    
+    Args:
+        error_details: The "error" value from a normalized PingOne response
+        messages: Friendly messages keyed by "400", "403" and "404";
+            INVALID_REQUEST errors use the "400" message
+        
+    Raises:
+        ToolError: Always, with the matching friendly message or the raw details
+    """
+    error_text = str(error_details)
+    match = _API_ERROR_RE.search(error_text)
+    if match:
+        code = "400" if match.group(1) == "INVALID_REQUEST" else match.group(1)
+        if code in messages:
+            raise ToolError(messages[code])
+    raise ToolError(f"API error: {error_text}")
@@ -0,0 +1,39 @@
+"""
+Shared httpx client construction for PingOne traffic.
+"""
+
+import httpx
+
+from .config import PingOneConfig
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+def make_pingone_client(config: PingOneConfig) -> httpx.AsyncClient:
+    """
+    Create an AsyncClient with a connection pool sized for PingOne.
+    
+    All traffic goes to a handful of PingOne hosts, so the pool keeps one
+    keep-alive connection per request slot allowed by the rate limiter and caps
+    total connections at twice that. Tune with PING_MAX_REQUESTS_PER_SECOND.
+    
+    HTTP/2 is negotiated when the h2 package is installed (httpx[http2]), so
+    concurrent token and API requests multiplex over one TLS connection.
+    
+    Args:
+        config: PingOne configuration
+    
+    Returns:
+        Configured httpx.AsyncClient; the caller owns it and must aclose() it
+    """
+    return httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        timeout=config.request_timeout,
+        limits=httpx.Limits(
+            max_connections=config.max_requests_per_second * 2,
+            max_keepalive_connections=config.max_requests_per_second
+        )
+    )
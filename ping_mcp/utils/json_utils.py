@@ -0,0 +1,92 @@
+"""
+JSON decoding for HTTP responses, using orjson and ijson when they are installed.
+"""
+
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+import httpx
+
+from .normalize_ping_responses import PingOneResponseHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+def parse_response_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson (a C parser, several times faster than the stdlib decoder on
+    large list pages) when available and falls back to response.json().
+    Both raise a ValueError subclass on invalid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+class _AsyncByteReader:
+    """Adapts an async byte-chunk iterator to the async read() ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes the stream type with read(0)
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+class StreamedListPage:
+    """
+    Items of one PingOne list page, decoded as the response body arrives.
+
+    Iterate to get the items of the first _embedded collection one by one (the
+    same collection PingOneResponseHandler.extract_embedded_data picks); next_url
+    holds _links.next.href once iteration has finished. With ijson installed only the
+    current item is held in memory; otherwise the body is read and decoded whole.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.next_url: Optional[str] = None
+
+    def __aiter__(self) -> AsyncGenerator[Dict[str, Any], None]:
+        if ijson is None:
+            return self._decode_whole()
+        return self._decode_incrementally()
+
+    async def _decode_whole(self) -> AsyncGenerator[Dict[str, Any], None]:
+        await self.response.aread()
+        normalized = PingOneResponseHandler.normalize_list_response(parse_response_json(self.response))
+        self.next_url = normalized["pagination"]["next_url"]
+        for item in normalized["items"]:
+            yield item
+
+    async def _decode_incrementally(self) -> AsyncGenerator[Dict[str, Any], None]:
+        reader = _AsyncByteReader(self.response.aiter_bytes())
+        builder = None
+        item_prefix = None  # e.g. "_embedded.users.item", fixed by the first list seen
+
+        async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event in ("end_map", "end_array"):
+                    yield builder.value
+                    builder = None
+            elif prefix == "_links.next.href" and event == "string":
+                self.next_url = value
+            elif item_prefix is None:
+                if event == "start_array" and prefix.startswith("_embedded.") and prefix.count(".") == 1:
+                    item_prefix = prefix + ".item"
+            elif prefix == item_prefix and event in ("start_map", "start_array"):
+                builder = ObjectBuilder()
+                builder.event(event, value)
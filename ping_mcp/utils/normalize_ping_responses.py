@@ -3,7 +3,7 @@ Generic PingOne API response handling and normalization.
 Focuses on response structure, pagination, and error handling rather than entity-specific normalization.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 import logging
 
 logger = logging.getLogger("ping_mcp_server")
@@ -28,10 +28,10 @@ class PingOneResponseHandler:
         embedded = response_data.get("_embedded", {})
         
         # Find the first list in _embedded (there's usually only one collection)
-        for key, value in embedded.items():
-            if isinstance(value, list):
-                logger.debug(f"Found embedded collection '{key}' with {len(value)} items")
-                return value
+        collection = next((value for value in embedded.values() if isinstance(value, list)), None)
+        if collection is not None:
+            logger.debug("Found embedded collection with %d items", len(collection))
+            return collection
         
         # Fallback: if response is directly a list
         if isinstance(response_data, list):
@@ -55,15 +55,21 @@ class PingOneResponseHandler:
         Returns:
             Dictionary with pagination info
         """
-        links = response_data.get("_links", {})
-        next_link = links.get("next", {})
+        links = response_data.get("_links")
+        if not isinstance(links, dict):
+            links = {}
+        
+        next_link = links.get("next")
+        next_href = next_link.get("href") if isinstance(next_link, dict) else None
+        self_link = links.get("self")
+        self_href = self_link.get("href") if isinstance(self_link, dict) else None
         
         return {
             "count": response_data.get("count", 0),
-            "size": response_data.get("size", 0), 
-            "has_next": "href" in next_link if isinstance(next_link, dict) else False,
-            "next_url": next_link.get("href") if isinstance(next_link, dict) else None,
-            "self_url": links.get("self", {}).get("href"),
+            "size": response_data.get("size", 0),
+            "has_next": next_href is not None,
+            "next_url": next_href,
+            "self_url": self_href,
         }
     
     @staticmethod
@@ -77,19 +83,18 @@ class PingOneResponseHandler:
         Returns:
             Dictionary with error info or None if no error
         """
-        if not isinstance(response_data, dict):
+        # Success responses carry neither key, so they exit on the first test
+        if not isinstance(response_data, dict) or ("code" not in response_data and "message" not in response_data):
             return None
-            
+        
         # PingOne error structure
-        if "code" in response_data or "message" in response_data:
-            return {
-                "code": response_data.get("code"),
-                "message": response_data.get("message"),
-                "details": response_data.get("details", []),
-                "correlation_id": response_data.get("correlationId")
-            }
-        
-        return None
+        get = response_data.get
+        return {
+            "code": get("code"),
+            "message": get("message"),
+            "details": get("details", []),
+            "correlation_id": get("correlationId")
+        }
     
     @classmethod
     def normalize_list_response(cls, response_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -141,44 +146,65 @@ class PingOneResponseHandler:
         return result
     
     @staticmethod
-    def filter_response_fields(item: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    def compile_fields(fields: Sequence[str]) -> List[Tuple[str, ...]]:
+        """
+        Split field names into key paths for filter_response_fields.
+        
+        Compile once before filtering many items so dotted names such as
+        "name.given" are not re-split for every item.
+        
+        Args:
+            fields: Field names, dotted for nested fields
+            
+        Returns:
+            List of key-path tuples
+        """
+        return [tuple(field.split(".")) for field in fields]
+    
+    @staticmethod
+    def filter_response_fields(item: Dict[str, Any],
+                               fields: Optional[Sequence[Union[str, Tuple[str, ...]]]] = None) -> Dict[str, Any]:
         """
         Filter response item to only include specified fields.
         Tools can use this to control what data they return.
+        Keeps no shared mutable state, so it is safe to call from concurrent
+        async tool calls.
         
         Args:
             item: Raw item dictionary
-            fields: List of field names to include, None for all fields
+            fields: Field names to include, or key paths from compile_fields; None for all fields
             
         Returns:
             Filtered item dictionary
         """
         if not fields or not isinstance(item, dict):
             return item
-            
+        
+        paths = fields if isinstance(fields[0], tuple) else PingOneResponseHandler.compile_fields(fields)
+        
         filtered = {}
-        for field in fields:
-            if "." in field:
-                # Handle nested fields like "name.given"
-                parts = field.split(".")
-                current = item
-                try:
-                    for part in parts[:-1]:
-                        current = current.get(part, {})
-                    if parts[-1] in current:
-                        # Create nested structure in filtered result
-                        target = filtered
-                        for part in parts[:-1]:
-                            if part not in target:
-                                target[part] = {}
-                            target = target[part]
-                        target[parts[-1]] = current[parts[-1]]
-                except (TypeError, AttributeError):
-                    continue
-            else:
+        for path in paths:
+            if len(path) == 1:
                 # Handle top-level fields
-                if field in item:
-                    filtered[field] = item[field]
+                key = path[0]
+                if key in item:
+                    filtered[key] = item[key]
+                continue
+            
+            # Handle nested fields like "name.given"
+            current = item
+            try:
+                for part in path[:-1]:
+                    current = current.get(part, {})
+                value = current[path[-1]]
+            except (KeyError, TypeError, AttributeError):
+                continue
+            
+            # Create nested structure in filtered result
+            target = filtered
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = value
         
         return filtered
     
@@ -3,8 +3,12 @@ Handles PingOne API pagination using _links.next pattern.
 """
 
 from typing import Dict, List, Any, Optional, AsyncGenerator
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import httpx
 
+from .normalize_ping_responses import PingOneResponseHandler
+from .json_utils import parse_response_json
+
 class PaginationHandler:
     """Handles PingOne's HATEOAS pagination with _links.next."""
     
@@ -14,36 +18,15 @@ class PaginationHandler:
     
     def extract_embedded_data(self, response_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract data from _embedded collections."""
-        embedded = response_data.get("_embedded", {})
-        
-        # Find the first list in _embedded (there's usually only one)
-        for key, value in embedded.items():
-            if isinstance(value, list):
-                return value
-        
-        # Fallback: if no _embedded, check for direct list
-        if isinstance(response_data, list):
-            return response_data
-        
-        return []
+        return PingOneResponseHandler.extract_embedded_data(response_data)
     
     def get_next_page_url(self, response_data: Dict[str, Any]) -> Optional[str]:
         """Extract next page URL from _links.next."""
-        links = response_data.get("_links", {})
-        next_link = links.get("next")
-        
-        if next_link and isinstance(next_link, dict):
-            return next_link.get("href")
-        
-        return None
+        return PingOneResponseHandler.extract_pagination_info(response_data)["next_url"]
     
     def get_pagination_info(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract pagination metadata."""
-        return {
-            "count": response_data.get("count", 0),
-            "size": response_data.get("size", 0),
-            "has_next": self.get_next_page_url(response_data) is not None
-        }
+        return PingOneResponseHandler.extract_pagination_info(response_data)
     
     def build_paginated_url(self, base_url: str, page_size: Optional[int] = None, 
                            cursor: Optional[str] = None) -> str:
@@ -83,16 +66,45 @@ class PaginationHandler:
             response = await http_client.get(current_url, headers=headers)
             response.raise_for_status()
             
-            response_data = response.json()
-            page_data = self.extract_embedded_data(response_data)
+            # One walk over the response yields both the items and the next link
+            normalized = PingOneResponseHandler.normalize_list_response(parse_response_json(response))
+            page_data = normalized["items"]
             
             if page_data:
                 yield page_data
             
             # Get next page URL
-            current_url = self.get_next_page_url(response_data)
+            current_url = normalized["pagination"]["next_url"]
             pages_fetched += 1
-            
-            # Break if no more pages
-            if not current_url:
-                break
\ No newline at end of file
+    
+    @staticmethod
+    def _set_query_param(url: str, name: str, value: Any) -> str:
+        """Return url with query parameter name set to value."""
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != name]
+        query.append((name, str(value)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+    
+    def offset_page_urls(self, pagination: Dict[str, Any], max_pages: int = 100) -> Optional[List[str]]:
+        """
+        Precompute the URLs of the remaining pages of an offset-paged collection.
+        
+        Args:
+            pagination: First page's pagination info (from get_pagination_info)
+            max_pages: Maximum pages in total, including the first
+        
+        Returns:
+            URLs for pages 2..N, or None when there is no next link, the link
+            pages by cursor, or the total count is unknown
+        """
+        next_url = pagination["next_url"]
+        total = pagination["count"]
+        page_size = pagination["size"]
+        if not (next_url and total and page_size):
+            return None
+        
+        if "offset" not in dict(parse_qsl(urlsplit(next_url).query)):
+            return None
+        
+        offsets = range(page_size, total, page_size)[:max_pages - 1]
+        return [self._set_query_param(next_url, "offset", offset) for offset in offsets]
@@ -2,12 +2,16 @@
 Main PingOne API client that orchestrates authentication, requests, and response handling.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional, AsyncGenerator
+from contextlib import aclosing
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple
 from urllib.parse import urljoin
 import httpx
 from .config import ConfigManager, PingOneConfig
 from .auth_manager import AuthManager
+from .http_client import make_pingone_client
+from .json_utils import parse_response_json, StreamedListPage
 from .rate_limiter import RateLimiter
 from .request_manager import RequestManager
 from .pagination_handler import PaginationHandler
@@ -42,46 +46,67 @@ class PingOneClient:
         
         self.response_handler = PingOneResponseHandler()
         
-        # Environment-specific components (created on-demand) - keyed by env_id
-        self._auth_managers: Dict[str, AuthManager] = {}
-        self._request_managers: Dict[str, RequestManager] = {}
+        # One pooled connection set shared by token requests and all API calls
+        self.http_client = make_pingone_client(self.config)
+        
+        # Environment-specific components (created on-demand) - keyed by (client_id, env_id)
+        self._auth_managers: Dict[Tuple[str, str], AuthManager] = {}
+        self._request_managers: Dict[Tuple[str, str], RequestManager] = {}
+        
+        # Normalized environment input -> resolved tuple; self.config is frozen, so entries never go stale
+        self._resolved_env_cache: Dict[str, Tuple[str, str, str, str]] = {}
+        
+        # env_id -> "https://api.../v1/environments/<env_id>/"
+        self._env_url_prefix: Dict[str, str] = {}
         
         logger.info(f"PingOne client initialized for region {self.config.region} with {len(self.config.environments)} environments")
     
     def _get_auth_manager(self, env_id: str, client_id: str, client_secret: str) -> AuthManager:
         """Get or create auth manager for specific environment."""
-        if env_id not in self._auth_managers:
+        key = (client_id, env_id)
+        if key not in self._auth_managers:
             auth_base_url = ConfigManager.get_auth_base_url(self.config.region)
-            self._auth_managers[env_id] = AuthManager(
+            self._auth_managers[key] = AuthManager(
                 auth_base_url=auth_base_url,
                 env_id=env_id,
                 client_id=client_id,
-                client_secret=client_secret
+                client_secret=client_secret,
+                http_client=self.http_client
             )
-        return self._auth_managers[env_id]
+        return self._auth_managers[key]
     
     def _get_request_manager(self, env_id: str, client_id: str, client_secret: str) -> RequestManager:
         """Get or create request manager for specific environment."""
-        if env_id not in self._request_managers:
+        key = (client_id, env_id)
+        if key not in self._request_managers:
             auth_manager = self._get_auth_manager(env_id, client_id, client_secret)
-            self._request_managers[env_id] = RequestManager(
+            self._request_managers[key] = RequestManager(
                 auth_manager=auth_manager,
                 rate_limiter=self.rate_limiter,
+                http_client=self.http_client,
                 max_retries=self.config.max_retries,
                 request_timeout=self.config.request_timeout
             )
-        return self._request_managers[env_id]
+        return self._request_managers[key]
     
     def _build_api_url(self, endpoint: str, env_id: str) -> str:
         """Build full API URL for an endpoint in specific environment."""
-        base_path = f"/v1/environments/{env_id}"
-        full_path = f"{base_path}/{endpoint.lstrip('/')}"
-        return urljoin(self.api_base_url, full_path)
+        prefix = self._env_url_prefix.get(env_id)
+        if prefix is None:
+            prefix = self._env_url_prefix[env_id] = urljoin(self.api_base_url, f"/v1/environments/{env_id}/")
+        return prefix + endpoint.lstrip("/")
     
     def _resolve_environment(self, environment: str = "") -> tuple[str, str, str, str]:
         """Resolve environment name to (name, id, client_id, client_secret) using config manager."""
-        env_name, env_config = ConfigManager.resolve_environment(self.config, environment)
-        return env_name, env_config.id, env_config.client_id, env_config.client_secret
+        # Same normalization as ConfigManager.resolve_environment, so case and
+        # whitespace variants of an alias share one entry
+        key = environment.strip().lower() if environment else ""
+        resolved = self._resolved_env_cache.get(key)
+        if resolved is None:
+            env_name, env_config = ConfigManager.resolve_environment(self.config, key)
+            resolved = (env_name, env_config.id, env_config.client_id, env_config.client_secret)
+            self._resolved_env_cache[key] = resolved
+        return resolved
     
     async def get(self, 
                  endpoint: str,
@@ -98,19 +123,20 @@ class PingOneClient:
         # Build URL
         url = self._build_api_url(endpoint, env_id)
         
-        # Handle pagination and query params
-        params = query_params or {}
+        # Handle pagination and query params (copied so the caller's dict is untouched)
+        params = dict(query_params) if query_params else None
         if paginated and page_size:
+            params = params or {}
             params["limit"] = str(page_size)
         
         # Make request
-        response = await request_manager.get(url, params=params if params else None)
+        response = await request_manager.get(url, params=params)
         
         if not response.is_success:
             logger.error(f"API request failed: {response.status_code} - {response.text}")
             response.raise_for_status()
         
-        response_data = response.json()
+        response_data = parse_response_json(response)
         
         # Normalize response
         if paginated:
@@ -123,6 +149,197 @@ class PingOneClient:
         
         return result
     
+    async def paginate(self,
+                       endpoint: str,
+                       query_params: Optional[Dict[str, str]] = None,
+                       environment: str = "",
+                       page_size: Optional[int] = None,
+                       max_pages: int = 100,
+                       prefetch: bool = True) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterate over a paginated PingOne list endpoint one page at a time.
+        
+        Each yielded page has the same shape as a paginated get() result, so
+        callers can process items as they arrive and stop early instead of
+        waiting for every page to be fetched.
+        
+        With prefetch, the next page is requested through the request manager
+        before the current one is yielded, so its round trip overlaps with the
+        caller's processing. The pending request is cancelled when the
+        generator is closed; callers that stop early should iterate inside
+        contextlib.aclosing(...) so that happens immediately.
+        
+        Args:
+            endpoint: API endpoint relative to the environment
+            query_params: Optional query parameters for the first page
+            environment: Environment name or alias, empty for default
+            page_size: Optional page size (sent as limit)
+            max_pages: Maximum pages to fetch (safety limit)
+            prefetch: Request the next page while the caller handles this one
+            
+        Yields:
+            Normalized list response for each page
+        """
+        env_name, env_id, client_id, client_secret = self._resolve_environment(environment)
+        request_manager = self._get_request_manager(env_id, client_id, client_secret)
+        env_info = {"name": env_name, "id": env_id}
+        
+        url = self._build_api_url(endpoint, env_id)
+        params = dict(query_params) if query_params else None
+        if page_size:
+            params = params or {}
+            params["limit"] = str(page_size)
+        
+        pages_fetched = 0
+        pending: Optional[asyncio.Task] = None
+        
+        try:
+            while url and pages_fetched < max_pages:
+                if pending is not None:
+                    response = await pending
+                    pending = None
+                else:
+                    response = await request_manager.get(url, params=params)
+                
+                if not response.is_success:
+                    logger.error(f"API request failed: {response.status_code} - {response.text}")
+                    response.raise_for_status()
+                
+                page = self.response_handler.normalize_list_response(parse_response_json(response))
+                page["environment"] = env_info
+                
+                # _links.next already carries the query string
+                url = page["pagination"]["next_url"]
+                params = None
+                pages_fetched += 1
+                
+                if prefetch and url and pages_fetched < max_pages:
+                    pending = asyncio.create_task(request_manager.get(url))
+                
+                yield page
+        finally:
+            # Consumer stopped early or a request failed: drop the pending fetch
+            if pending is not None:
+                pending.cancel()
+                if pending.done() and not pending.cancelled():
+                    pending.exception()
+    
+    async def get_stream(self,
+                         endpoint: str,
+                         query_params: Optional[Dict[str, str]] = None,
+                         environment: str = "",
+                         page_size: Optional[int] = None,
+                         max_pages: int = 100) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterate over the items of a paginated list endpoint as they are decoded.
+        
+        Intended for large listings: with ijson installed each page is parsed
+        from the socket incrementally, so memory per page is one item rather than
+        the whole response body. Without ijson each page is decoded whole.
+        Consumers that may stop early should iterate inside
+        contextlib.aclosing(client.get_stream(...)) so the open response is
+        closed as soon as they break out, rather than when the generator is
+        garbage collected.
+        
+        Args:
+            endpoint: API endpoint relative to the environment
+            query_params: Optional query parameters for the first page
+            environment: Environment name or alias, empty for default
+            page_size: Optional page size (sent as limit)
+            max_pages: Maximum pages to fetch (safety limit)
+            
+        Yields:
+            Raw items from each page's _embedded collection
+        """
+        env_name, env_id, client_id, client_secret = self._resolve_environment(environment)
+        request_manager = self._get_request_manager(env_id, client_id, client_secret)
+        
+        url = self._build_api_url(endpoint, env_id)
+        params = dict(query_params) if query_params else None
+        if page_size:
+            params = params or {}
+            params["limit"] = str(page_size)
+        
+        pages_fetched = 0
+        while url and pages_fetched < max_pages:
+            async with request_manager.stream("GET", url, params=params) as response:
+                if not response.is_success:
+                    await response.aread()
+                    logger.error(f"API request failed: {response.status_code} - {response.text}")
+                    response.raise_for_status()
+                
+                page = StreamedListPage(response)
+                items = page.__aiter__()
+                try:
+                    async for item in items:
+                        yield item
+                finally:
+                    # Release the connection now if the consumer stopped early
+                    await items.aclose()
+                    await response.aclose()
+            
+            # _links.next already carries the query string
+            url = page.next_url
+            params = None
+            pages_fetched += 1
+    
+    async def get_all_pages(self,
+                            endpoint: str,
+                            query_params: Optional[Dict[str, str]] = None,
+                            environment: str = "",
+                            page_size: Optional[int] = None,
+                            max_pages: int = 100,
+                            concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Fetch every page of a list endpoint and return one combined result.
+        
+        When the first page reports a total count and its next link pages by
+        offset, the remaining pages are requested concurrently, at most
+        `concurrency` at a time, through the request manager. Cursor-paged
+        endpoints are followed one page at a time through paginate().
+        
+        Args:
+            endpoint: API endpoint relative to the environment
+            query_params: Optional query parameters for the first page
+            environment: Environment name or alias, empty for default
+            page_size: Optional page size (sent as limit)
+            max_pages: Maximum pages to fetch (safety limit)
+            concurrency: Maximum page requests in flight for offset paging
+            
+        Returns:
+            Normalized list response holding the items of all pages; pagination
+            describes the first page
+        """
+        # No prefetch: nothing happens between pages here for it to overlap with
+        async with aclosing(self.paginate(endpoint, query_params, environment, page_size,
+                                          max_pages, prefetch=False)) as pages:
+            result = await pages.__anext__()
+            items = list(result["items"])
+            
+            urls = self.pagination_handler.offset_page_urls(result["pagination"], max_pages)
+            if urls is None:
+                async for page in pages:
+                    items.extend(page["items"])
+        
+        if urls is not None:
+            env_name, env_id, client_id, client_secret = self._resolve_environment(environment)
+            request_manager = self._get_request_manager(env_id, client_id, client_secret)
+            semaphore = asyncio.Semaphore(concurrency)
+            
+            async def fetch_page(url: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    response = await request_manager.get(url)
+                if not response.is_success:
+                    logger.error(f"API request failed: {response.status_code} - {response.text}")
+                    response.raise_for_status()
+                return self.response_handler.normalize_list_response(parse_response_json(response))["items"]
+            
+            for page_items in await asyncio.gather(*(fetch_page(url) for url in urls)):
+                items.extend(page_items)
+        
+        result["items"] = items
+        return result
+    
     async def post(self,
                   endpoint: str,
                   body: Optional[Dict[str, Any]] = None,
@@ -137,19 +354,14 @@ class PingOneClient:
         # Build URL
         url = self._build_api_url(endpoint, env_id)
         
-        # Add query params to URL if provided
-        if query_params:
-            param_string = "&".join([f"{k}={v}" for k, v in query_params.items()])
-            url = f"{url}?{param_string}"
-        
         # Make request
-        response = await request_manager.post(url, json_data=body)
+        response = await request_manager.post(url, json_data=body, params=query_params)
         
         if not response.is_success:
             logger.error(f"API request failed: {response.status_code} - {response.text}")
             response.raise_for_status()
         
-        response_data = response.json()
+        response_data = parse_response_json(response)
         result = self.response_handler.normalize_single_response(response_data)
         
         # Add environment context
@@ -171,19 +383,14 @@ class PingOneClient:
         # Build URL
         url = self._build_api_url(endpoint, env_id)
         
-        # Add query params to URL if provided
-        if query_params:
-            param_string = "&".join([f"{k}={v}" for k, v in query_params.items()])
-            url = f"{url}?{param_string}"
-        
         # Make request
-        response = await request_manager.put(url, json_data=body)
+        response = await request_manager.put(url, json_data=body, params=query_params)
         
         if not response.is_success:
             logger.error(f"API request failed: {response.status_code} - {response.text}")
             response.raise_for_status()
         
-        response_data = response.json()
+        response_data = parse_response_json(response)
         result = self.response_handler.normalize_single_response(response_data)
         
         # Add environment context
@@ -204,19 +411,14 @@ class PingOneClient:
         # Build URL
         url = self._build_api_url(endpoint, env_id)
         
-        # Add query params to URL if provided
-        if query_params:
-            param_string = "&".join([f"{k}={v}" for k, v in query_params.items()])
-            url = f"{url}?{param_string}"
-        
         # Make request
-        response = await request_manager.delete(url)
+        response = await request_manager.delete(url, params=query_params)
         
         if not response.is_success:
             logger.error(f"API request failed: {response.status_code} - {response.text}")
             response.raise_for_status()
         
-        response_data = response.json()
+        response_data = parse_response_json(response)
         result = self.response_handler.normalize_single_response(response_data)
         
         # Add environment context
@@ -238,6 +440,16 @@ class PingOneClient:
         """Get list of available environments with details."""
         return ConfigManager.get_available_environments(self.config)
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.http_client.aclose()
+    
+    async def __aenter__(self) -> "PingOneClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
     async def get_organization_level(
         self,
         endpoint: str,
@@ -262,40 +474,31 @@ class PingOneClient:
                 if paginated and 'limit' not in query_params:
                     query_params['limit'] = page_size
             
-            # Get auth manager for default environment
-            auth_manager = self._get_auth_manager(env_id, client_id, client_secret)
-            token = await auth_manager.get_valid_token()
+            # Same request path as environment calls: rate limiting, retries, auth
+            request_manager = self._get_request_manager(env_id, client_id, client_secret)
+            response = await request_manager.get(url, params=query_params)
+            response.raise_for_status()
             
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
+            data = parse_response_json(response)
             
-            # Make request
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, params=query_params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Handle pagination
-                if paginated and "_embedded" in data:
-                    # Extract items from embedded structure
-                    if "environments" in data["_embedded"]:
-                        items = data["_embedded"]["environments"]
-                    else:
-                        # Generic extraction for other embedded resources
-                        embedded_key = list(data["_embedded"].keys())[0]
-                        items = data["_embedded"][embedded_key]
+            # Handle pagination
+            if paginated and "_embedded" in data:
+                # Extract items from embedded structure
+                if "environments" in data["_embedded"]:
+                    items = data["_embedded"]["environments"]
                 else:
-                    items = data
-                
-                return {
-                    "success": True,
-                    "items": items if paginated else data,
-                    "raw_response": data
-                }
-                
+                    # Generic extraction for other embedded resources
+                    embedded_key = list(data["_embedded"].keys())[0]
+                    items = data["_embedded"][embedded_key]
+            else:
+                items = data
+            
+            return {
+                "success": True,
+                "items": items if paginated else data,
+                "raw_response": data
+            }
+            
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error in organization-level call: {e}")
             return {
@@ -6,38 +6,43 @@ import asyncio
 import time
 from typing import Optional
 from datetime import datetime, timezone
-import re
+from email.utils import parsedate_to_datetime
 
 class TokenBucket:
     """Token bucket rate limiter with Retry-After support."""
     
+    __slots__ = ("max_requests", "tokens", "last_update")
+    
     def __init__(self, max_requests_per_second: int = 50):
         self.max_requests = max_requests_per_second
         self.tokens = float(max_requests_per_second)
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+        self.last_update = time.monotonic()
     
     async def acquire(self) -> None:
-        """Acquire a token from the bucket, waiting if necessary."""
-        async with self.lock:
-            now = time.time()
-            # Add tokens based on elapsed time
-            elapsed = now - self.last_update
-            self.tokens = min(self.max_requests, self.tokens + elapsed * self.max_requests)
-            self.last_update = now
-            
-            if self.tokens >= 1:
-                self.tokens -= 1
-                return
-            
-            # Wait for next token
-            wait_time = (1 - self.tokens) / self.max_requests
-            await asyncio.sleep(wait_time)
-            self.tokens = 0
+        """
+        Acquire a token from the bucket, waiting if necessary.
+        
+        The token is taken before sleeping, so the balance can go negative and
+        concurrent callers queue up behind each other's reservations. The update
+        has no await, so it runs atomically on the event loop without a lock and
+        no caller holds the bucket while it sleeps.
+        """
+        now = time.monotonic()
+        # Add tokens based on elapsed time
+        elapsed = now - self.last_update
+        self.tokens = min(self.max_requests, self.tokens + elapsed * self.max_requests)
+        self.last_update = now
+        
+        self.tokens -= 1
+        if self.tokens < 0:
+            # Wait until this reservation's token has been refilled
+            await asyncio.sleep(-self.tokens / self.max_requests)
 
 class RetryAfterHandler:
     """Handles Retry-After header parsing and validation."""
     
+    __slots__ = ()
+    
     MAX_RETRY_AFTER_SECONDS = 300  # 5 minutes max for security
     
     @classmethod
@@ -58,36 +63,26 @@ class RetryAfterHandler:
                 return float(seconds)
             return None
         
-        # Try parsing as HTTP date
+        # Try parsing as HTTP date (RFC 7231: IMF-fixdate, RFC 850 or asctime)
         try:
-            # Common HTTP date formats
-            date_formats = [
-                "%a, %d %b %Y %H:%M:%S GMT",
-                "%A, %d-%b-%y %H:%M:%S GMT", 
-                "%a %b %d %H:%M:%S %Y"
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    target_time = datetime.strptime(retry_after_value, fmt)
-                    target_time = target_time.replace(tzinfo=timezone.utc)
-                    now = datetime.now(timezone.utc)
-                    
-                    wait_seconds = (target_time - now).total_seconds()
-                    if 0 <= wait_seconds <= cls.MAX_RETRY_AFTER_SECONDS:
-                        return wait_seconds
-                    break
-                except ValueError:
-                    continue
-                    
-        except Exception:
-            pass
+            target_time = parsedate_to_datetime(retry_after_value)
+        except (TypeError, ValueError):
+            return None
+        
+        if target_time.tzinfo is None:
+            target_time = target_time.replace(tzinfo=timezone.utc)
+        
+        wait_seconds = (target_time - datetime.now(timezone.utc)).total_seconds()
+        if 0 <= wait_seconds <= cls.MAX_RETRY_AFTER_SECONDS:
+            return wait_seconds
         
         return None
 
 class RateLimiter:
     """Main rate limiter with token bucket and retry-after handling."""
     
+    __slots__ = ("token_bucket", "retry_after_handler")
+    
     def __init__(self, max_requests_per_second: int = 50):
         self.token_bucket = TokenBucket(max_requests_per_second)
         self.retry_after_handler = RetryAfterHandler()
@@ -3,8 +3,10 @@ HTTP request manager with retry logic, error handling, and rate limiting integra
 """
 
 import asyncio
+import random
 import httpx
-from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, AsyncIterator
 import logging
 from datetime import datetime
 
@@ -16,9 +18,19 @@ logger = logging.getLogger("ping_mcp_server")
 class RequestManager:
     """Manages HTTP requests with retry logic and rate limiting."""
     
+    __slots__ = ("auth_manager", "rate_limiter", "max_retries", "request_timeout",
+                 "_base_delay", "_max_delay", "_base_headers", "_client")
+    
+    # HTTP status codes that are retryable
+    retryable_status_codes = frozenset({408, 429, 500, 502, 503, 504})
+    
+    # HTTP status codes that require auth refresh
+    auth_error_codes = frozenset({401, 403})
+    
     def __init__(self, 
                  auth_manager: AuthManager,
                  rate_limiter: RateLimiter,
+                 http_client: httpx.AsyncClient,
                  max_retries: int = 3,
                  request_timeout: int = 30):
         self.auth_manager = auth_manager
@@ -26,35 +38,35 @@ class RequestManager:
         self.max_retries = max_retries
         self.request_timeout = request_timeout
         
-        # HTTP status codes that are retryable
-        self.retryable_status_codes = {408, 429, 500, 502, 503, 504}
+        # Exponential backoff bounds in seconds
+        self._base_delay = 1.0
+        self._max_delay = 30.0
         
-        # HTTP status codes that require auth refresh
-        self.auth_error_codes = {401, 403}
-    
-    async def _calculate_retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
-        """Calculate delay before retry attempt."""
+        # Headers sent with every request. Kept off the shared client, which
+        # also carries form-encoded token requests.
+        self._base_headers = {
+            "User-Agent": "PingOne-MCP-Server/1.0",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
         
-        # If we have a Retry-After header, handle it first
-        if retry_after:
-            handled = await self.rate_limiter.handle_retry_after(retry_after)
-            if handled:
-                return 0  # Already waited in handle_retry_after
+        # Pool shared with every manager; PingOneClient owns and closes it
+        self._client = http_client
+    
+    def _compute_backoff(self, attempt: int) -> float:
+        """Calculate backoff delay before a retry attempt."""
         
         # Exponential backoff with jitter (1s, 2s, 4s, 8s...)
-        base_delay = 1.0
-        max_delay = 30.0
-        delay = min(base_delay * (2 ** attempt), max_delay)
+        delay = min(self._base_delay * (1 << attempt), self._max_delay)
         
         # Add jitter (±25% randomness)
-        import random
         jitter = delay * 0.25 * (2 * random.random() - 1)
         final_delay = max(0.1, delay + jitter)
         
-        logger.debug(f"Retry attempt {attempt + 1}: waiting {final_delay:.2f}s")
+        logger.debug("Retry attempt %d: waiting %.2fs", attempt + 1, final_delay)
         return final_delay
     
-    async def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
         """Determine if request should be retried."""
         
         if attempt >= self.max_retries:
@@ -86,32 +98,25 @@ class RequestManager:
         # Get auth headers
         auth_headers = await self.auth_manager.get_auth_header()
         
-        # Merge headers
-        request_headers = {
-            "User-Agent": "PingOne-MCP-Server/1.0",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        
+        # Merge headers in one pass; auth always wins
         if headers:
-            request_headers.update(headers)
-        
-        request_headers.update(auth_headers)
+            request_headers = {**self._base_headers, **headers, **auth_headers}
+        else:
+            request_headers = {**self._base_headers, **auth_headers}
         
         # Make request
-        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-            logger.debug(f"{method} {url}")
-            
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                params=params,
-                json=json_data
-            )
-            
-            logger.debug(f"Response: {response.status_code}")
-            return response
+        logger.debug("%s %s", method, url)
+        
+        response = await self._client.request(
+            method=method,
+            url=url,
+            headers=request_headers,
+            params=params,
+            json=json_data
+        )
+        
+        logger.debug("Response: %s", response.status_code)
+        return response
     
     async def request(self,
                      method: str,
@@ -147,7 +152,7 @@ class RequestManager:
                     return response
                 
                 # Check if we should retry
-                if not await self._should_retry(response, attempt):
+                if not self._should_retry(response, attempt):
                     logger.warning(f"Request failed with {response.status_code}, no more retries")
                     return response
                 
@@ -156,12 +161,10 @@ class RequestManager:
                     logger.info("Auth error, refreshing token")
                     self.auth_manager.invalidate_token()
                 
-                # Calculate retry delay
+                # Honour a valid Retry-After header (the limiter waits), else back off
                 retry_after = response.headers.get("Retry-After")
-                delay = await self._calculate_retry_delay(attempt, retry_after)
-                
-                if delay > 0:
-                    await asyncio.sleep(delay)
+                if not (retry_after and await self.rate_limiter.handle_retry_after(retry_after)):
+                    await asyncio.sleep(self._compute_backoff(attempt))
                 
                 last_response = response
                 
@@ -170,16 +173,14 @@ class RequestManager:
                 if attempt >= self.max_retries:
                     raise
                 
-                delay = await self._calculate_retry_delay(attempt)
-                await asyncio.sleep(delay)
+                await asyncio.sleep(self._compute_backoff(attempt))
                 
             except httpx.NetworkError as e:
                 logger.warning(f"Network error on attempt {attempt + 1}: {e}")
                 if attempt >= self.max_retries:
                     raise
                 
-                delay = await self._calculate_retry_delay(attempt)
-                await asyncio.sleep(delay)
+                await asyncio.sleep(self._compute_backoff(attempt))
         
         # If we get here, all retries failed
         if last_response:
@@ -187,18 +188,51 @@ class RequestManager:
         else:
             raise httpx.RequestError("All retry attempts failed")
     
+    @asynccontextmanager
+    async def stream(self,
+                     method: str,
+                     url: str,
+                     params: Optional[Dict[str, Any]] = None) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed request whose body is read inside the with block.
+        
+        Rate limited and authenticated like request(), but not retried: a
+        partially consumed body cannot be replayed.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Optional query parameters
+            
+        Yields:
+            HTTP response with an unread body
+        """
+        await self.rate_limiter.wait_if_needed()
+        auth_headers = await self.auth_manager.get_auth_header()
+        
+        logger.debug("%s %s (stream)", method, url)
+        async with self._client.stream(
+            method,
+            url,
+            headers={**self._base_headers, **auth_headers},
+            params=params
+        ) as response:
+            yield response
+    
     async def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         """Make GET request."""
         return await self.request("GET", url, params=params)
     
-    async def post(self, url: str, json_data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    async def post(self, url: str, json_data: Optional[Dict[str, Any]] = None,
+                   params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         """Make POST request."""
-        return await self.request("POST", url, json_data=json_data)
+        return await self.request("POST", url, params=params, json_data=json_data)
     
-    async def put(self, url: str, json_data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    async def put(self, url: str, json_data: Optional[Dict[str, Any]] = None,
+                  params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         """Make PUT request.""" 
-        return await self.request("PUT", url, json_data=json_data)
+        return await self.request("PUT", url, params=params, json_data=json_data)
     
-    async def delete(self, url: str) -> httpx.Response:
+    async def delete(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
         """Make DELETE request."""
-        return await self.request("DELETE", url)
\ No newline at end of file
+        return await self.request("DELETE", url, params=params)
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+Process-wide switches shared by the tool modules.
+"""
+
+import logging
+import os
+
+# Set PING_MCP_PROGRESS=0 to skip ctx.report_progress round trips
+PROGRESS_ENABLED = os.environ.get("PING_MCP_PROGRESS", "1") == "1"
+
+def info_logging_enabled(logger: logging.Logger) -> bool:
+    """
+    Check whether tool calls should emit INFO logs.
+    
+    Log level is configured before tools are registered, so tool classes call
+    this once at construction instead of on every tool call.
+    
+    Args:
+        logger: Logger the tool module writes to
+        
+    Returns:
+        True if INFO records would be emitted
+    """
+    return logger.isEnabledFor(logging.INFO)
@@ -0,0 +1,99 @@
+"""
+Small in-process LRU cache with per-entry TTL for short-lived API reads.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+class AsyncTTLCache:
+    """LRU cache whose entries expire after a fixed TTL.
+
+    Concurrent misses for the same key are collapsed into a single load
+    (single-flight), so a burst of identical lookups issues one API call.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 15.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # key -> in-flight load shared by every concurrent caller for that key
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or the whole cache when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(self,
+                          key: Hashable,
+                          loader: Callable[[], Awaitable[Any]],
+                          cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+            cache_if: Optional predicate; values failing it are returned but not cached
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader, cache_if))
+            task.add_done_callback(functools.partial(self._on_load_done, key))
+            self._inflight[key] = task
+
+        # Shielded: one cancelled caller must not cancel the load the others await
+        return await asyncio.shield(task)
+
+    async def _load(self,
+                    key: Hashable,
+                    loader: Callable[[], Awaitable[Any]],
+                    cache_if: Optional[Callable[[Any], bool]]) -> Any:
+        """Run loader once and cache its value if cache_if allows."""
+        value = await loader()
+        if cache_if is None or cache_if(value):
+            self.set(key, value)
+        return value
+
+    def _on_load_done(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished load; its callers already hold the result or exception."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled
+            task.exception()
@@ -0,0 +1,14 @@
+"""
+Input validation helpers shared by PingOne MCP tools.
+"""
+
+import re
+
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
+def is_valid_uuid(value: str) -> bool:
+    """Check if a string is a valid UUID format."""
+    return bool(_UUID_RE.match(value))